@@ -1,221 +1,590 @@
 #!/usr/bin/env python3
 
-from boto3.session import Session
+# boto3, kubernetes and yaml are imported where they are used, so that
+# --help and argument errors don't pay for loading them
 from botocore.exceptions import ClientError, EndpointConnectionError
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import argparse
-import subprocess
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+import time
 import json
-import yaml
 import sys
 from packaging import version
 
+# Regions and the clusters within them are independent, so their AWS and
+# Kubernetes API calls are overlapped. Kubernetes calls are additionally
+# capped to bound the number of node and pod listings held in flight.
+REGION_WORKERS = 8
+CLUSTER_WORKERS = 16
+NODEGROUP_WORKERS = 8
+K8S_CONCURRENCY = 10
+
+# Page size for Kubernetes list calls, so large clusters are returned by the
+# API server in chunks rather than as one payload
+LIST_CHUNK_SIZE = 500
+
+# Enabled regions change rarely, so describe_regions results are cached on
+# disk for a week
+REGION_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Header binding a presigned STS GetCallerIdentity request to a cluster,
+# which is what EKS bearer tokens are
+K8S_AWS_ID_HEADER = 'x-k8s-aws-id'
+K8S_TOKEN_PREFIX = 'k8s-aws-v1.'
+
+_client_lock = threading.Lock()
+_core_v1_lock = threading.Lock()
+_core_v1_clients = {}
+_ca_cert_dir = None
+_k8s_slots = threading.Semaphore(K8S_CONCURRENCY)
+
+@lru_cache(maxsize=None)
+def _boto_config():
+    """botocore Config shared by every AWS client
+    
+    Adaptive retries back off client-side when EKS starts throttling the
+    concurrent workers. A region's EKS client is shared by its cluster
+    workers, each running NODEGROUP_WORKERS describe_nodegroup calls, so
+    the connection pool is sized for all of them at once.
+    """
+    from botocore.config import Config
+    return Config(
+        retries={'max_attempts': 10, 'mode': 'adaptive'},
+        max_pool_connections=CLUSTER_WORKERS * NODEGROUP_WORKERS
+    )
+
+def _k8s_errors():
+    """Errors from a cluster's Kubernetes API, reported per cluster rather than aborting the run"""
+    import urllib3
+    from kubernetes.client.rest import ApiException
+    return (OSError, ApiException, urllib3.exceptions.HTTPError)
+
+@lru_cache(maxsize=1024)
+def _parse_version(v):
+    """Parse a version string, fast-pathing the plain MAJOR.MINOR[.PATCH] format
+    
+    Plain versions become int tuples with trailing zeros dropped, so that
+    "1.27" and "1.27.0" compare equal as they do with packaging. Anything
+    else is handed to packaging.
+    """
+    parts = v.split('.')
+    if all(part.isdecimal() for part in parts):
+        release = [int(part) for part in parts]
+        while len(release) > 1 and release[-1] == 0:
+            release.pop()
+        return tuple(release)
+    return version.parse(v)
+
 def compare_versions(v1, v2):
     """Compare two Kubernetes versions"""
+    if v1 == v2:
+        return 0
     try:
-        ver1 = version.parse(v1)
-        ver2 = version.parse(v2)
+        ver1 = _parse_version(v1)
+        ver2 = _parse_version(v2)
+        if type(ver1) is not type(ver2):
+            # One side isn't a plain release; compare both through packaging
+            ver1 = version.parse(v1)
+            ver2 = version.parse(v2)
         return (ver1 > ver2) - (ver1 < ver2)
     except version.InvalidVersion:
         return 0
 
-def get_fargate_pods(cluster_name, region):
-    """Get Fargate pods using kubectl"""
+def kubelet_minor_version(kubelet_version):
+    """Reduce a kubelet version such as v1.26.5-eks-2d98532 to MAJOR.MINOR
+    
+    Control plane and managed nodegroup versions are reported as
+    MAJOR.MINOR, so node versions are compared at the same precision.
+    """
+    if kubelet_version.startswith('v'):
+        kubelet_version = kubelet_version[1:]
+    release = kubelet_version.split('-', 1)[0].split('+', 1)[0]
+    return '.'.join(release.split('.')[:2])
+
+def _stash_k8s_aws_id(params, context, **kwargs):
+    """Move the cluster ID out of GetCallerIdentity params into the request context"""
+    if K8S_AWS_ID_HEADER in params:
+        context[K8S_AWS_ID_HEADER] = params.pop(K8S_AWS_ID_HEADER)
+
+def _inject_k8s_aws_id(request, **kwargs):
+    """Add the stashed cluster ID header so it is covered by the signature"""
+    if K8S_AWS_ID_HEADER in request.context:
+        request.headers[K8S_AWS_ID_HEADER] = request.context[K8S_AWS_ID_HEADER]
+
+def _create_sts_client(session, region):
+    """Create an STS client that can presign EKS bearer tokens"""
+    sts = session.client('sts', region_name=region, config=_boto_config())
+    sts.meta.events.register('provide-client-params.sts.GetCallerIdentity', _stash_k8s_aws_id)
+    sts.meta.events.register('before-sign.sts.GetCallerIdentity', _inject_k8s_aws_id)
+    return sts
+
+def _get_cluster_token(sts, cluster_name):
+    """Generate a bearer token for the cluster, as aws eks get-token does"""
+    url = sts.generate_presigned_url(
+        'get_caller_identity',
+        Params={K8S_AWS_ID_HEADER: cluster_name},
+        ExpiresIn=60,
+        HttpMethod='GET'
+    )
+    return K8S_TOKEN_PREFIX + base64.urlsafe_b64encode(url.encode()).decode().rstrip('=')
+
+def _write_ca_cert(cluster):
+    """Write the cluster's CA bundle to a file for the Kubernetes client"""
+    global _ca_cert_dir
+    with _core_v1_lock:
+        if _ca_cert_dir is None:
+            _ca_cert_dir = tempfile.TemporaryDirectory(prefix='eks-versions-')
+    fd, path = tempfile.mkstemp(suffix='.crt', dir=_ca_cert_dir.name)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(base64.b64decode(cluster['certificateAuthority']['data']))
+    return path
+
+def _get_core_v1(sts, cluster):
+    """Get a Kubernetes CoreV1Api for the cluster, creating it on first use
+    
+    The client is configured straight from describe_cluster output and a
+    locally presigned token, so neither a kubeconfig nor the AWS CLI is
+    involved. Each cluster keeps its own ApiClient: endpoints differ, so
+    a shared connection pool would not carry connections across clusters.
+    """
+    with _core_v1_lock:
+        core_v1 = _core_v1_clients.get(cluster['arn'])
+    if core_v1 is not None:
+        return core_v1
+    
+    from kubernetes import client as k8s_client
+    
+    configuration = k8s_client.Configuration()
+    configuration.host = cluster['endpoint']
+    configuration.ssl_ca_cert = _write_ca_cert(cluster)
+    configuration.api_key = {'authorization': _get_cluster_token(sts, cluster['name'])}
+    configuration.api_key_prefix = {'authorization': 'Bearer'}
+    
+    core_v1 = k8s_client.CoreV1Api(k8s_client.ApiClient(configuration))
+    with _core_v1_lock:
+        return _core_v1_clients.setdefault(cluster['arn'], core_v1)
+
+def _list_items(list_func, **kwargs):
+    """Collect every item from a Kubernetes list call, LIST_CHUNK_SIZE at a time
+    
+    Pages are read raw, skipping model deserialization, and each response's
+    connection is returned to the pool once decoded.
+    """
+    items = []
+    continue_token = None
+    while True:
+        if continue_token:
+            kwargs['_continue'] = continue_token
+        with _k8s_slots:
+            response = list_func(limit=LIST_CHUNK_SIZE, _preload_content=False, **kwargs)
+            try:
+                page = json.loads(response.data)
+            finally:
+                response.release_conn()
+        items.extend(page['items'])
+        continue_token = page['metadata'].get('continue')
+        if not continue_token:
+            return items
+
+def get_fargate_pods(sts, cluster):
+    """Get Fargate pods using the Kubernetes API"""
     try:
-        # Get pods with fargate node selector
-        result = subprocess.run([
-            'kubectl', 'get', 'pods',
-            '--all-namespaces',
-            '--field-selector', 'spec.nodeName!=',
-            '-o', 'json'
-        ], check=True, capture_output=True, text=True)
+        core_v1 = _get_core_v1(sts, cluster)
         
-        pods = json.loads(result.stdout)
-        fargate_pods = [pod for pod in pods['items'] 
+        # Get scheduled pods
+        pods = _list_items(core_v1.list_pod_for_all_namespaces, field_selector='spec.nodeName!=')
+        fargate_pods = [pod for pod in pods 
                        if pod.get('spec', {}).get('schedulerName') == 'fargate-scheduler']
         return fargate_pods
-    except subprocess.CalledProcessError as e:
+    except _k8s_errors() as e:
         print(f"Error getting Fargate pods: {e}", file=sys.stderr)
         return []
 
-def get_cluster_nodes(cluster_name, region):
-    """Get the actual Kubernetes nodes using kubectl"""
+def get_cluster_nodes(sts, cluster):
+    """Get the actual Kubernetes nodes using the Kubernetes API
+    
+    Returns None if the nodes couldn't be listed, so callers can tell a
+    failed listing apart from a cluster without nodes.
+    """
     try:
-        # Update kubeconfig for the cluster
-        subprocess.run([
-            'aws', 'eks', 'update-kubeconfig',
-            '--name', cluster_name,
-            '--region', region
-        ], check=True, capture_output=True)
-        
-        # Get nodes using kubectl
-        result = subprocess.run([
-            'kubectl', 'get', 'nodes',
-            '-o', 'json'
-        ], check=True, capture_output=True, text=True)
+        core_v1 = _get_core_v1(sts, cluster)
         
-        nodes = json.loads(result.stdout)
-        return nodes['items']
-    except subprocess.CalledProcessError as e:
+        # Get nodes
+        return _list_items(core_v1.list_node)
+    except _k8s_errors() as e:
         print(f"Error getting nodes: {e}", file=sys.stderr)
-        return []
+        return None
 
-def check_version_filters(control_plane_version, node_versions, version_filters):
-    """Check if cluster matches version filters"""
+def _plain_release(v):
+    """Parse a plain [v]MAJOR.MINOR[.PATCH] version, or return None for anything else"""
+    if v[:1] in ('v', 'V'):
+        v = v[1:]
+    if not all(part.isdecimal() for part in v.split('.')):
+        return None
+    return _parse_version(v)
+
+def version_bound(value):
+    """Parse a --min-version/--max-version argument into a comparable version
+    
+    Bounds must be plain [v]MAJOR.MINOR[.PATCH] versions, the format EKS
+    reports for control planes, so they compare directly against them.
+    """
+    parsed = _plain_release(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"invalid version '{value}', expected MAJOR.MINOR[.PATCH]")
+    return parsed
+
+@lru_cache(maxsize=1024)
+def check_control_plane_filters(control_plane_version, version_filters):
+    """Check if the control plane version matches the exact/min/max filters
+    
+    version_filters is the same hashable tuple check_version_filters takes.
+    """
     if not version_filters:
         return True
+    version_filters = dict(version_filters)
         
     if version_filters.get('exact'):
         if control_plane_version != version_filters['exact']:
             return False
             
+    # A control plane version that isn't a plain release can't be ordered
+    # against the bounds, so like compare_versions it is left unfiltered
+    control_plane_release = _plain_release(control_plane_version)
+    if control_plane_release is None:
+        return True
+            
     if version_filters.get('min'):
-        if compare_versions(control_plane_version, version_filters['min']) < 0:
+        if control_plane_release < version_filters['min']:
             return False
             
     if version_filters.get('max'):
-        if compare_versions(control_plane_version, version_filters['max']) > 0:
+        if control_plane_release > version_filters['max']:
             return False
             
-    if version_filters.get('outdated'):
-        # Check for version mismatches between control plane and nodes
-        if len(node_versions) > 1:  # Multiple node versions exist
-            return True
-        if node_versions and compare_versions(list(node_versions)[0], control_plane_version) != 0:
-            return True
+    return True
+
+@lru_cache(maxsize=4096)
+def check_version_filters(control_plane_version, node_versions, version_filters):
+    """Check if cluster matches version filters
+    
+    Results are cached, so node_versions must be a frozenset and
+    version_filters a tuple of (name, value) pairs, as built by main().
+    The 'min' and 'max' bounds are already parsed by version_bound().
+    """
+    if not check_control_plane_filters(control_plane_version, version_filters):
         return False
+    version_filters = dict(version_filters or ())
+        
+    if version_filters.get('outdated'):
+        # Check for version mismatches between control plane and nodes.
+        # Multiple node versions are a mismatch, no nodes are not.
+        if len(node_versions) != 1:
+            return bool(node_versions)
+        node_version = next(iter(node_versions))
+        if node_version == control_plane_version:
+            return False
+        return compare_versions(node_version, control_plane_version) != 0
         
     return True
 
+def _describe_nodegroup(eks, cluster_name, ng_name):
+    """Describe a single managed nodegroup, returning None on error"""
+    try:
+        ng = eks.describe_nodegroup(
+            clusterName=cluster_name,
+            nodegroupName=ng_name
+        )['nodegroup']
+        
+        return {
+            'name': ng_name,
+            'status': ng['status'],
+            'instance_types': ng['instanceTypes'],
+            'ami_version': ng.get('amiVersion', 'N/A'),
+            'k8s_version': ng.get('version', 'N/A'),
+            'scaling': {
+                'desired': ng['scalingConfig']['desiredSize'],
+                'max': ng['scalingConfig']['maxSize'],
+                'min': ng['scalingConfig']['minSize']
+            },
+            'tags': ng.get('tags', {})
+        }
+        
+    except ClientError as e:
+        print(f"Error describing nodegroup {ng_name}: {e.response['Error']['Message']}", 
+              file=sys.stderr)
+        return None
+
+def get_managed_nodegroups(eks, cluster_name):
+    """Get EKS managed nodegroups for a cluster"""
+    try:
+        nodegroups = [
+            name
+            for page in eks.get_paginator('list_nodegroups').paginate(
+                clusterName=cluster_name,
+                PaginationConfig={'PageSize': 100}
+            )
+            for name in page['nodegroups']
+        ]
+    except ClientError as e:
+        print(f"Error listing nodegroups: {e.response['Error']['Message']}", file=sys.stderr)
+        return []
+    
+    with ThreadPoolExecutor(max_workers=NODEGROUP_WORKERS) as executor:
+        described = executor.map(
+            lambda ng_name: _describe_nodegroup(eks, cluster_name, ng_name),
+            nodegroups
+        )
+        return [nodegroup_info for nodegroup_info in described if nodegroup_info is not None]
+
+def _process_cluster(eks, sts, cluster_name, version_filters):
+    """Collect version and compute information for a single cluster"""
+    try:
+        cluster = eks.describe_cluster(name=cluster_name)['cluster']
+        control_plane_version = cluster['version']
+        
+        # Control plane filters only need describe_cluster, so clusters they
+        # reject skip every other call
+        if not check_control_plane_filters(control_plane_version, version_filters):
+            return None
+        
+        # Get actual nodes. Nodes are part of every output format, so they
+        # are listed for every cluster anyway, and unlike managed nodegroup
+        # versions their kubelet versions also cover self-managed and
+        # Karpenter nodes.
+        k8s_nodes = get_cluster_nodes(sts, cluster)
+        
+        if dict(version_filters or ()).get('outdated'):
+            # The outdated filter is the one that needs node versions
+            node_versions = {
+                kubelet_minor_version(node['status']['nodeInfo']['kubeletVersion'])
+                for node in k8s_nodes or ()
+            }
+            if not check_version_filters(control_plane_version, frozenset(node_versions), version_filters):
+                return None
+        
+        # Check for EKS managed nodegroups
+        managed_nodegroups = get_managed_nodegroups(eks, cluster_name)
+        
+        # Get Fargate pods
+        fargate_pods = get_fargate_pods(sts, cluster)
+        
+        cluster_info = {
+            'name': cluster_name,
+            'control_plane': {
+                'version': control_plane_version,
+                'status': cluster['status'],
+                'platform_version': cluster.get('platformVersion', 'N/A'),
+                'endpoint': cluster['endpoint']
+            },
+            'tags': cluster.get('tags', {}),
+            'compute': {
+                'managed_nodegroups': managed_nodegroups,
+                'nodes': [],
+                'fargate': {
+                    'pods': []
+                }
+            }
+        }
+        
+        # Add Kubernetes node information
+        add_node = cluster_info['compute']['nodes'].append
+        for node in k8s_nodes or ():
+            metadata = node['metadata']
+            status = node['status']
+            labels = metadata.get('labels', {})
+            add_node({
+                'name': metadata['name'],
+                'status': status['conditions'][-1]['type'],
+                'instance_type': labels.get('node.kubernetes.io/instance-type', 'N/A'),
+                'k8s_version': status['nodeInfo']['kubeletVersion'],
+                'capacity': status.get('capacity', {}),
+                'labels': labels
+            })
+        
+        # Count each managed nodegroup's nodes locally from the label EKS puts
+        # on them, rather than asking the EKS API again. If the nodes couldn't
+        # be listed the counts are unknown, not zero.
+        nodegroup_node_counts = defaultdict(int)
+        for node_info in cluster_info['compute']['nodes']:
+            nodegroup_node_counts[node_info['labels'].get('eks.amazonaws.com/nodegroup')] += 1
+        for nodegroup_info in managed_nodegroups:
+            nodegroup_info['node_count'] = (
+                'N/A' if k8s_nodes is None else nodegroup_node_counts[nodegroup_info['name']]
+            )
+        
+        # Add Fargate pod information
+        for pod in fargate_pods:
+            pod_info = {
+                'name': pod['metadata']['name'],
+                'namespace': pod['metadata']['namespace'],
+                'status': pod['status']['phase'],
+                'labels': pod['metadata'].get('labels', {})
+            }
+            cluster_info['compute']['fargate']['pods'].append(pod_info)
+        
+        return cluster_info
+        
+    except ClientError as e:
+        print(f"Error describing cluster {cluster_name}: {e.response['Error']['Message']}", 
+              file=sys.stderr)
+        return None
+
+def _process_region(session, region, specific_cluster, version_filters):
+    """Collect information for every (or one specific) cluster in a region"""
+    clusters = []
+    try:
+        # Client creation on a shared Session is not thread-safe, but the
+        # resulting client is and can be used from the cluster workers
+        with _client_lock:
+            eks = session.client('eks', region_name=region, config=_boto_config())
+            sts = _create_sts_client(session, region)
+        
+        if specific_cluster:
+            cluster_names = [specific_cluster]
+        else:
+            cluster_names = [
+                name
+                for page in eks.get_paginator('list_clusters').paginate(PaginationConfig={'PageSize': 100})
+                for name in page['clusters']
+            ]
+        
+        with ThreadPoolExecutor(max_workers=CLUSTER_WORKERS) as executor:
+            futures = [
+                executor.submit(_process_cluster, eks, sts, cluster_name, version_filters)
+                for cluster_name in cluster_names
+            ]
+            # Collect in submission order so output stays stable between runs
+            for future in futures:
+                cluster_info = future.result()
+                if cluster_info is not None:
+                    clusters.append(cluster_info)
+                
+    except EndpointConnectionError:
+        print(f"Unable to connect to region {region}", file=sys.stderr)
+    except ClientError as e:
+        print(f"Error accessing EKS in region {region}: {e.response['Error']['Message']}", 
+              file=sys.stderr)
+        
+    return clusters
+
+def _region_cache_path(session):
+    """Path of the region list cache for the session's partition and credentials
+    
+    Enabled opt-in regions differ between accounts, and profile names don't
+    tell accounts apart (environment and instance role credentials all look
+    like 'default'), so the file is keyed on a hash of the access key ID.
+    Returns None when there are no credentials or region to key on.
+    """
+    credentials = session.get_credentials()
+    if credentials is None or not session.region_name:
+        return None
+    partition = session.get_partition_for_region(session.region_name)
+    key_id = hashlib.sha256(credentials.access_key.encode()).hexdigest()[:16]
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'eks-version-manager', f"regions-{partition}-{key_id}.json")
+
+def _load_cached_regions(session):
+    """Get the cached region list, or None if it is missing, stale or unreadable"""
+    path = _region_cache_path(session)
+    if path is None:
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) >= REGION_CACHE_TTL:
+            return None
+        with open(path) as f:
+            regions = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(regions, list) or not all(isinstance(region, str) for region in regions):
+        return None
+    return regions
+
+def _save_cached_regions(session, regions):
+    """Cache the region list, replacing the cache file atomically"""
+    path = _region_cache_path(session)
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(regions, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Unable to cache AWS regions: {e}", file=sys.stderr)
+
 def get_all_eks_info(specific_region=None, specific_cluster=None, version_filters=None):
+    """Yield (region, {'clusters': [...]}) pairs in region order as each region completes"""
+    from boto3.session import Session
+    
     session = Session()
     
     try:
         if specific_region:
             regions = [specific_region]
         else:
-            ec2 = session.client('ec2')
-            regions = [region['RegionName'] for region in ec2.describe_regions()['Regions']]
+            regions = _load_cached_regions(session)
+            if regions is None:
+                ec2 = session.client('ec2', config=_boto_config())
+                regions = [region['RegionName'] for region in ec2.describe_regions()['Regions']]
+                _save_cached_regions(session, regions)
     except ClientError as e:
         print(f"Error getting AWS regions: {e.response['Error']['Message']}", file=sys.stderr)
-        return {}
-        
-    result = {}
-    for region in regions:
-        result[region] = {"clusters": []}
+        return
         
-        try:
-            eks = session.client('eks', region_name=region)
-            
-            if specific_cluster:
-                clusters = [specific_cluster]
-            else:
-                clusters = eks.list_clusters()['clusters']
-            
-            for cluster_name in clusters:
-                try:
-                    cluster = eks.describe_cluster(name=cluster_name)['cluster']
-                    control_plane_version = cluster['version']
-                    
-                    # Get actual nodes and their versions
-                    k8s_nodes = get_cluster_nodes(cluster_name, region)
-                    node_versions = {node['status']['nodeInfo']['kubeletVersion'] for node in k8s_nodes}
-                    
-                    # Check version filters
-                    if not check_version_filters(control_plane_version, node_versions, version_filters):
-                        continue
-                    
-                    # Get Fargate pods
-                    fargate_pods = get_fargate_pods(cluster_name, region)
-                    
-                    cluster_info = {
-                        'name': cluster_name,
-                        'control_plane': {
-                            'version': control_plane_version,
-                            'status': cluster['status'],
-                            'platform_version': cluster.get('platformVersion', 'N/A'),
-                            'endpoint': cluster['endpoint']
-                        },
-                        'tags': cluster.get('tags', {}),
-                        'compute': {
-                            'managed_nodegroups': [],
-                            'nodes': [],
-                            'fargate': {
-                                'pods': []
-                            }
-                        }
-                    }
-                    
-                    # Add Kubernetes node information
-                    for node in k8s_nodes:
-                        node_info = {
-                            'name': node['metadata']['name'],
-                            'status': node['status']['conditions'][-1]['type'],
-                            'instance_type': node['metadata']['labels'].get('node.kubernetes.io/instance-type', 'N/A'),
-                            'k8s_version': node['status']['nodeInfo']['kubeletVersion'],
-                            'capacity': node['status'].get('capacity', {}),
-                            'labels': node['metadata'].get('labels', {})
-                        }
-                        cluster_info['compute']['nodes'].append(node_info)
-                    
-                    # Add Fargate pod information
-                    for pod in fargate_pods:
-                        pod_info = {
-                            'name': pod['metadata']['name'],
-                            'namespace': pod['metadata']['namespace'],
-                            'status': pod['status']['phase'],
-                            'labels': pod['metadata'].get('labels', {})
-                        }
-                        cluster_info['compute']['fargate']['pods'].append(pod_info)
-                    
-                    # Check for EKS managed nodegroups
-                    try:
-                        nodegroup_response = eks.list_nodegroups(clusterName=cluster_name)
-                        if 'nodegroups' in nodegroup_response and nodegroup_response['nodegroups']:
-                            nodegroups = nodegroup_response['nodegroups']
-                            for ng_name in nodegroups:
-                                try:
-                                    ng = eks.describe_nodegroup(
-                                        clusterName=cluster_name,
-                                        nodegroupName=ng_name
-                                    )['nodegroup']
-                                    
-                                    nodegroup_info = {
-                                        'name': ng_name,
-                                        'status': ng['status'],
-                                        'instance_types': ng['instanceTypes'],
-                                        'ami_version': ng.get('amiVersion', 'N/A'),
-                                        'k8s_version': ng.get('version', 'N/A'),
-                                        'scaling': {
-                                            'desired': ng['scalingConfig']['desiredSize'],
-                                            'max': ng['scalingConfig']['maxSize'],
-                                            'min': ng['scalingConfig']['minSize']
-                                        },
-                                        'tags': ng.get('tags', {})
-                                    }
-                                    
-                                    cluster_info['compute']['managed_nodegroups'].append(nodegroup_info)
-                                    
-                                except ClientError as e:
-                                    print(f"Error describing nodegroup {ng_name}: {e.response['Error']['Message']}", 
-                                          file=sys.stderr)
-                                
-                    except ClientError as e:
-                        print(f"Error listing nodegroups: {e.response['Error']['Message']}", file=sys.stderr)
-                    
-                    result[region]['clusters'].append(cluster_info)
-                    
-                except ClientError as e:
-                    print(f"Error describing cluster {cluster_name}: {e.response['Error']['Message']}", 
-                          file=sys.stderr)
-                        
-        except EndpointConnectionError:
-            print(f"Unable to connect to region {region}", file=sys.stderr)
-        except ClientError as e:
-            print(f"Error accessing EKS in region {region}: {e.response['Error']['Message']}", 
-                  file=sys.stderr)
-            
-    return result
+    with ThreadPoolExecutor(max_workers=REGION_WORKERS) as executor:
+        futures = [
+            executor.submit(_process_region, session, region, specific_cluster, version_filters)
+            for region in regions
+        ]
+        for region, future in zip(regions, futures):
+            yield region, {"clusters": future.result()}
+
+def write_json(clusters, out):
+    """Write (region, data) pairs as one JSON object, serializing per region
+    
+    The output is identical to json.dumps(dict(clusters), indent=2).
+    """
+    separator = '{\n'
+    for region, data in clusters:
+        out.write(separator)
+        # Strip the braces of the single-region object; its members are
+        # already indented for the enclosing one
+        out.write(json.dumps({region: data}, indent=2)[2:-2])
+        separator = ',\n'
+    out.write('{}\n' if separator == '{\n' else '\n}\n')
+
+def write_yaml(clusters, out):
+    """Write (region, data) pairs as one YAML mapping, serializing per region
+    
+    Each region is serialized as it is yielded, but regions are written in
+    sorted order once all have arrived, matching yaml.dump's sorted keys.
+    """
+    import yaml
+    # The libyaml-backed dumper is much faster on large outputs; PyYAML
+    # may have been built without it
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    
+    documents = {
+        region: yaml.dump({region: data}, Dumper=dumper, default_flow_style=False)
+        for region, data in clusters
+    }
+    if not documents:
+        out.write(yaml.dump({}, Dumper=dumper, default_flow_style=False))
+    for region in sorted(documents):
+        out.write(documents[region])
+    out.write('\n')
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -248,8 +617,10 @@ Examples:
     output_group.add_argument('--yaml', action='store_true', help='Output in YAML format')
     
     version_group = parser.add_argument_group('version filtering')
-    version_group.add_argument('--min-version', help='Show only clusters with version >= specified (e.g., 1.24)')
-    version_group.add_argument('--max-version', help='Show only clusters with version <= specified (e.g., 1.27)')
+    version_group.add_argument('--min-version', type=version_bound,
+                             help='Show only clusters with version >= specified (e.g., 1.24)')
+    version_group.add_argument('--max-version', type=version_bound,
+                             help='Show only clusters with version <= specified (e.g., 1.27)')
     version_group.add_argument('--exact-version', help='Show only clusters matching exact version')
     version_group.add_argument('--outdated', action='store_true', 
                              help='Show only clusters where control plane and node versions mismatch')
@@ -275,18 +646,22 @@ def main():
         version_filters['max'] = args.max_version
     if args.outdated:
         version_filters['outdated'] = True
+    # Hashable form so filter results can be cached across clusters
+    version_filters = tuple(sorted(version_filters.items()))
     
     clusters = get_all_eks_info(args.region, args.cluster, version_filters)
     
+    # Each region is serialized as it arrives, overlapping with the regions
+    # still being collected
     if args.json:
-        print(json.dumps(clusters, indent=2))
+        write_json(clusters, sys.stdout)
         return
     elif args.yaml:
-        print(yaml.dump(clusters, default_flow_style=False))
+        write_yaml(clusters, sys.stdout)
         return
         
-    # Print human-readable summary
-    for region, data in clusters.items():
+    # Print human-readable summary, each region as soon as it is collected
+    for region, data in clusters:
         if not data['clusters']:
             if args.debug:
                 print(f"\nNo matching clusters found in region: {region}")
@@ -322,6 +697,7 @@ def main():
                     print(f"      K8s Version: {ng['k8s_version']}")
                     print(f"      Instance Types: {', '.join(ng['instance_types'])}")
                     print(f"      Desired/Min/Max: {ng['scaling']['desired']}/{ng['scaling']['min']}/{ng['scaling']['max']}")
+                    print(f"      Nodes: {ng['node_count']}")
                     if ng['tags']:
                         print(f"      Tags:")
                         for key, value in ng['tags'].items():
@@ -348,6 +724,9 @@ def main():
                     print(f"      Status: {pod['status']}")
             else:
                 print("\n  No Fargate pods found")
+        
+        # Show the region now even when stdout is a pipe
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
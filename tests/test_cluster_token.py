@@ -0,0 +1,24 @@
+import base64
+from urllib.parse import parse_qs, urlsplit
+import boto3
+from eks_versions import K8S_AWS_ID_HEADER, K8S_TOKEN_PREFIX, _create_sts_client, _get_cluster_token
+
+def decode_token(token):
+    encoded = token[len(K8S_TOKEN_PREFIX):]
+    return base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode()
+
+def test_cluster_token():
+    """Test that the token presigns GetCallerIdentity with the cluster ID as a signed header"""
+    session = boto3.session.Session(
+        aws_access_key_id="AKIDEXAMPLE",
+        aws_secret_access_key="secret",
+        region_name="us-west-2",
+    )
+    token = _get_cluster_token(_create_sts_client(session, "us-west-2"), "my-cluster")
+    assert token.startswith(K8S_TOKEN_PREFIX)
+
+    url = decode_token(token)
+    query = parse_qs(urlsplit(url).query)
+    assert "X-Amz-SignedHeaders=host%3Bx-k8s-aws-id" in url
+    assert query["Action"] == ["GetCallerIdentity"]
+    assert K8S_AWS_ID_HEADER not in {key.lower() for key in query}
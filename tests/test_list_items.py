@@ -0,0 +1,42 @@
+import json
+import pytest
+from eks_versions import LIST_CHUNK_SIZE, _list_items
+
+class FakeResponse:
+    def __init__(self, page):
+        self.data = json.dumps(page).encode()
+        self.released = False
+
+    def release_conn(self):
+        self.released = True
+
+def test_list_items_pages():
+    """Test that every page is collected, passing the continue token back"""
+    pages = [
+        {"items": [{"name": "a"}, {"name": "b"}], "metadata": {"continue": "token-1"}},
+        {"items": [{"name": "c"}], "metadata": {}},
+    ]
+    calls = []
+    responses = []
+
+    def list_func(**kwargs):
+        calls.append(dict(kwargs))
+        responses.append(FakeResponse(pages[len(responses)]))
+        return responses[-1]
+
+    items = _list_items(list_func, field_selector="spec.nodeName=x")
+    assert items == [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+    assert calls == [
+        {"limit": LIST_CHUNK_SIZE, "_preload_content": False, "field_selector": "spec.nodeName=x"},
+        {"limit": LIST_CHUNK_SIZE, "_preload_content": False, "field_selector": "spec.nodeName=x",
+         "_continue": "token-1"},
+    ]
+    assert all(response.released for response in responses)
+
+def test_list_items_releases_on_bad_page():
+    """Test that the connection is released even if the page can't be decoded"""
+    response = FakeResponse({})
+    response.data = b"not json"
+    with pytest.raises(ValueError):
+        _list_items(lambda **kwargs: response)
+    assert response.released
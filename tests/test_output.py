@@ -0,0 +1,31 @@
+import io
+import json
+import pytest
+import yaml
+from eks_versions import write_json, write_yaml
+
+CLUSTERS = {
+    "us-east-1": {"clusters": []},
+    "us-west-2": {"clusters": [{"name": "my-cluster", "tags": {}, "versions": ["1.27", "1.28"]}]},
+}
+
+@pytest.mark.parametrize("clusters", [{}, CLUSTERS])
+def test_write_json(clusters):
+    """Test that streamed JSON matches a single json.dumps of all regions"""
+    out = io.StringIO()
+    write_json(iter(clusters.items()), out)
+    assert out.getvalue() == json.dumps(clusters, indent=2) + "\n"
+
+@pytest.mark.parametrize("clusters", [{}, CLUSTERS])
+def test_write_yaml(clusters):
+    """Test that streamed YAML is a single mapping of all regions"""
+    out = io.StringIO()
+    write_yaml(iter(clusters.items()), out)
+    assert yaml.safe_load(out.getvalue()) == clusters
+
+@pytest.mark.parametrize("clusters", [{}, CLUSTERS])
+def test_write_yaml_matches_single_dump(clusters):
+    """Test that streamed YAML is byte-identical to a single yaml.dump, even for unsorted regions"""
+    out = io.StringIO()
+    write_yaml(reversed(list(clusters.items())), out)
+    assert out.getvalue() == yaml.dump(clusters, default_flow_style=False) + "\n"
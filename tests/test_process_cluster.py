@@ -0,0 +1,100 @@
+import pytest
+import eks_versions
+from eks_versions import _process_cluster, kubelet_minor_version
+
+OUTDATED = (("outdated", True),)
+
+class FakeEKS:
+    def __init__(self, control_plane_version):
+        self.control_plane_version = control_plane_version
+
+    def describe_cluster(self, name):
+        return {"cluster": {
+            "name": name,
+            "arn": f"arn:aws:eks:us-west-2:123456789012:cluster/{name}",
+            "version": self.control_plane_version,
+            "status": "ACTIVE",
+            "endpoint": "https://example.com",
+        }}
+
+def process(control_plane_version, version_filters=OUTDATED):
+    return _process_cluster(FakeEKS(control_plane_version), None, "c", version_filters)
+
+def make_nodegroup(k8s_version):
+    return {"name": f"ng-{k8s_version}", "k8s_version": k8s_version}
+
+def make_node(kubelet_version, nodegroup=None):
+    labels = {"eks.amazonaws.com/nodegroup": nodegroup} if nodegroup else {}
+    return {
+        "metadata": {"name": f"node-{kubelet_version}", "labels": labels},
+        "status": {"conditions": [{"type": "Ready"}], "nodeInfo": {"kubeletVersion": kubelet_version}},
+    }
+
+@pytest.fixture
+def cluster_compute(monkeypatch):
+    """Stub out nodegroups, nodes and pods, recording the lookups made"""
+    compute = {"nodegroups": [], "nodes": [], "node_listings": 0, "nodegroup_listings": 0}
+
+    def get_managed_nodegroups(*args):
+        compute["nodegroup_listings"] += 1
+        return compute["nodegroups"]
+
+    def get_cluster_nodes(*args):
+        compute["node_listings"] += 1
+        return compute["nodes"]
+
+    monkeypatch.setattr(eks_versions, "get_managed_nodegroups", get_managed_nodegroups)
+    monkeypatch.setattr(eks_versions, "get_cluster_nodes", get_cluster_nodes)
+    monkeypatch.setattr(eks_versions, "get_fargate_pods", lambda *args: [])
+    return compute
+
+def test_kubelet_minor_version():
+    """Test reduction of kubelet versions to MAJOR.MINOR"""
+    assert kubelet_minor_version("v1.26.5-eks-2d98532") == "1.26"
+    assert kubelet_minor_version("v1.27.4") == "1.27"
+    assert kubelet_minor_version("1.28") == "1.28"
+
+def test_outdated_old_node(cluster_compute):
+    """Test that a node behind the control plane matches, listing nodes once"""
+    cluster_compute["nodegroups"] = [make_nodegroup("1.27")]
+    cluster_compute["nodes"] = [make_node("v1.27.4-eks-1", "ng-1.27"), make_node("v1.26.5-eks-2d98532")]
+    assert process("1.27") is not None
+    assert cluster_compute["node_listings"] == 1
+
+def test_outdated_current_nodes(cluster_compute):
+    """Test that a cluster with current nodes is rejected before describing nodegroups"""
+    cluster_compute["nodes"] = [make_node("v1.27.4-eks-1"), make_node("v1.27.9-eks-1")]
+    assert process("1.27") is None
+    assert cluster_compute["node_listings"] == 1
+    assert cluster_compute["nodegroup_listings"] == 0
+
+def test_outdated_ignores_empty_nodegroup_versions(cluster_compute):
+    """Test that an old nodegroup scaled to zero doesn't make the cluster outdated"""
+    cluster_compute["nodegroups"] = [make_nodegroup("1.26")]
+    cluster_compute["nodes"] = [make_node("v1.27.4-eks-1")]
+    assert process("1.27") is None
+
+def test_no_filters_lists_everything(cluster_compute):
+    """Test that clusters are kept and fully described without filters"""
+    cluster_compute["nodegroups"] = [make_nodegroup("1.27")]
+    cluster_compute["nodes"] = [make_node("v1.27.4-eks-1", "ng-1.27")]
+    info = process("1.27", ())
+    assert [ng["name"] for ng in info["compute"]["managed_nodegroups"]] == ["ng-1.27"]
+    assert [node["k8s_version"] for node in info["compute"]["nodes"]] == ["v1.27.4-eks-1"]
+
+def test_nodegroup_node_counts(cluster_compute):
+    """Test that nodegroup node counts come from the nodegroup label"""
+    cluster_compute["nodegroups"] = [make_nodegroup("1.27"), make_nodegroup("1.26")]
+    cluster_compute["nodes"] = [make_node("v1.27.4-eks-1", "ng-1.27"), make_node("v1.27.4-eks-1", "ng-1.27")]
+    nodegroups = process("1.27", ())["compute"]["managed_nodegroups"]
+    assert [ng["node_count"] for ng in nodegroups] == [2, 0]
+
+def test_failed_node_listing(cluster_compute):
+    """Test that a failed node listing leaves nodegroup node counts unknown"""
+    cluster_compute["nodegroups"] = [make_nodegroup("1.27")]
+    cluster_compute["nodes"] = None
+    info = process("1.27", ())
+    assert info["compute"]["nodes"] == []
+    assert info["compute"]["managed_nodegroups"][0]["node_count"] == "N/A"
+    assert process("1.27") is None
+    assert cluster_compute["node_listings"] == 2
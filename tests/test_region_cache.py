@@ -0,0 +1,58 @@
+import os
+import time
+import types
+import pytest
+from eks_versions import REGION_CACHE_TTL, _load_cached_regions, _region_cache_path, _save_cached_regions
+
+class FakeSession:
+    def __init__(self, access_key="AKIDEXAMPLE", region_name="us-west-2"):
+        self.access_key = access_key
+        self.region_name = region_name
+
+    def get_credentials(self):
+        return types.SimpleNamespace(access_key=self.access_key) if self.access_key else None
+
+    def get_partition_for_region(self, region_name):
+        return "aws-cn" if region_name.startswith("cn-") else "aws"
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+def test_round_trip():
+    """Test that saved regions are loaded back"""
+    session = FakeSession()
+    assert _load_cached_regions(session) is None
+    _save_cached_regions(session, ["us-east-1", "us-west-2"])
+    assert _load_cached_regions(session) == ["us-east-1", "us-west-2"]
+
+def test_keyed_by_credentials_and_partition():
+    """Test that different accounts and partitions don't share a cache file"""
+    _save_cached_regions(FakeSession(), ["us-east-1"])
+    assert _load_cached_regions(FakeSession(access_key="AKIDOTHER")) is None
+    assert _load_cached_regions(FakeSession(region_name="cn-north-1")) is None
+    assert "AKIDEXAMPLE" not in _region_cache_path(FakeSession())
+
+def test_no_credentials_skips_cache():
+    """Test that the cache isn't used without credentials to key it on"""
+    session = FakeSession(access_key=None)
+    _save_cached_regions(session, ["us-east-1"])
+    assert _load_cached_regions(session) is None
+
+def test_ttl_expiry():
+    """Test that a cache older than the TTL is ignored"""
+    session = FakeSession()
+    _save_cached_regions(session, ["us-east-1"])
+    stale = time.time() - REGION_CACHE_TTL - 1
+    os.utime(_region_cache_path(session), (stale, stale))
+    assert _load_cached_regions(session) is None
+
+@pytest.mark.parametrize("contents", ["not json", '{"us-east-1": {}}', "[1, 2]"])
+def test_corrupt_cache(contents):
+    """Test that an unreadable cache falls back to None"""
+    session = FakeSession()
+    _save_cached_regions(session, ["us-east-1"])
+    with open(_region_cache_path(session), "w") as f:
+        f.write(contents)
+    assert _load_cached_regions(session) is None
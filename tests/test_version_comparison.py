@@ -18,3 +18,15 @@ def test_invalid_version():
     assert compare_versions("invalid", "1.27") == 0
     assert compare_versions("1.27", "invalid") == 0
     assert compare_versions("invalid1", "invalid2") == 0
+
+def test_version_comparison_trailing_zero():
+    """Test that a missing patch number equals a zero patch number"""
+    assert compare_versions("1.27", "1.27.0") == 0
+    assert compare_versions("1.27.0", "1.27") == 0
+    assert compare_versions("1.27", "1.27.1") < 0
+
+def test_version_comparison_mixed_formats():
+    """Test comparison between plain and non-plain version strings"""
+    assert compare_versions("1.27", "v1.27") == 0
+    assert compare_versions("1.28", "1.28rc1") > 0
+    assert compare_versions("1.27rc1", "1.27") < 0
@@ -0,0 +1,48 @@
+import argparse
+import pytest
+from eks_versions import check_control_plane_filters, check_version_filters, version_bound
+
+def test_no_filters():
+    """Test that every cluster matches when no filters are set"""
+    assert check_version_filters("1.27", frozenset({"1.26"}), ())
+
+def test_min_max_filters():
+    """Test control plane version bounds"""
+    assert check_version_filters("1.27", frozenset(), (("min", version_bound("1.27")),))
+    assert not check_version_filters("1.26", frozenset(), (("min", version_bound("1.27")),))
+    assert check_version_filters("1.27", frozenset(), (("max", version_bound("1.27.0")),))
+    assert not check_version_filters("1.28", frozenset(), (("max", version_bound("1.27")),))
+
+def test_outdated_filter():
+    """Test detection of node versions that differ from the control plane"""
+    outdated = (("outdated", True),)
+    assert not check_version_filters("1.27", frozenset(), outdated)
+    assert not check_version_filters("1.27", frozenset({"1.27"}), outdated)
+    assert not check_version_filters("1.27", frozenset({"1.27.0"}), outdated)
+    assert check_version_filters("1.27", frozenset({"1.26"}), outdated)
+    assert check_version_filters("1.27", frozenset({"1.27", "1.26"}), outdated)
+
+def test_invalid_version_bound():
+    """Test that version bounds must be plain MAJOR.MINOR[.PATCH] versions"""
+    with pytest.raises(argparse.ArgumentTypeError):
+        version_bound("invalid")
+    with pytest.raises(argparse.ArgumentTypeError):
+        version_bound("1.27rc1")
+
+def test_control_plane_filters():
+    """Test that control plane filters don't depend on node versions"""
+    assert check_control_plane_filters("1.27", (("exact", "1.27"), ("outdated", True)))
+    assert not check_control_plane_filters("1.28", (("exact", "1.27"),))
+    assert not check_control_plane_filters("1.26", (("min", version_bound("1.27")),))
+
+def test_version_bound_v_prefix():
+    """Test that version bounds accept a leading v"""
+    assert version_bound("v1.25") == version_bound("1.25")
+    assert version_bound("V1.25.0") == version_bound("1.25")
+
+def test_non_plain_control_plane_version():
+    """Test that odd control plane versions are kept rather than raising"""
+    bounds = (("max", version_bound("1.30")), ("min", version_bound("1.25")))
+    assert check_control_plane_filters("v1.27", bounds)
+    assert check_control_plane_filters("1.27-eks", bounds)
+    assert not check_control_plane_filters("v1.24", bounds)